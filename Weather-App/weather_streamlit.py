@@ -4,16 +4,38 @@ Weather dashboard — Streamlit UI.
 Uses Open-Meteo API (free, no key required).
 """
 
-import random
+import numpy as np
+import orjson
 import streamlit as st
-import requests
+import requests_cache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+from requests.adapters import HTTPAdapter
 from streamlit_searchbox import st_searchbox
+from urllib3.util.retry import Retry
 
 # --- API endpoints ---
 WEATHER_API  = "https://api.open-meteo.com/v1/forecast"
 GEO_API      = "https://geocoding-api.open-meteo.com/v1/search"
 
+# --- Shared HTTP session (keep-alive + on-disk response cache) ---
+# SQLite-backed, so cached responses survive st.cache_data.clear() and even
+# process restarts. City names barely move, forecasts do — hence the split TTLs.
+_SESSION = requests_cache.CachedSession(
+    ".omcache",
+    backend="sqlite",
+    expire_after=900,
+    urls_expire_after={
+        "geocoding-api.open-meteo.com": 604800,   # 7 days
+        "api.open-meteo.com/v1/forecast": 600,    # 10 minutes
+    },
+)
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=2, pool_maxsize=10,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+))
+
 # --- Default city ---
 DEFAULT_LOCATION = {
     "name": "Bothell",
@@ -51,12 +73,28 @@ WMO_CODES = {
     99: ("Thunderstorm + hail",  "⛈️"),
 }
 
+# Open-Meteo timestamps are fixed-width, so parse with explicit formats
+# instead of fromisoformat's variable-format handling.
+_CUR_TIME_FMT = "%Y-%m-%dT%H:%M"
+_DAILY_DATE_FMT = "%Y-%m-%d"
+
+# Single shared fallback so lookups don't build a fresh default tuple per call.
+_WMO_UNKNOWN = ("Unknown", "❓")
+
+
+def wmo_label(code):
+    return WMO_CODES.get(code) or _WMO_UNKNOWN
+
+
 WIND_DIRS = ["N","NNE","NE","ENE","E","ESE","SE","SSE",
              "S","SSW","SW","WSW","W","WNW","NW","NNW"]
 
+# Compass label per integer degree, built once — lookup is a single index.
+_WIND_DIR_TABLE = tuple(WIND_DIRS[int((d + 11.25) // 22.5) % 16] for d in range(361))
+
 
 def wind_dir_label(degrees):
-    return WIND_DIRS[round(degrees / 22.5) % 16]
+    return _WIND_DIR_TABLE[int(degrees) % 361]
 
 
 def location_label(loc):
@@ -70,25 +108,85 @@ def location_label(loc):
 @st.cache_data(ttl=3600)
 def geocode(query: str):
     """Return list of matching locations for a city name query."""
-    r = requests.get(GEO_API, params={"name": query, "count": 5, "language": "en"}, timeout=10)
+    r = _SESSION.get(GEO_API, params={"name": query, "count": 5, "language": "en"}, timeout=10)
     r.raise_for_status()
-    return r.json().get("results", [])
+    return orjson.loads(r.content).get("results", [])
 
 
 def search_cities(query: str):
-    """Called on every keystroke — returns (label, loc_dict) pairs for the dropdown."""
-    if not query or len(query.strip()) < 2:
+    """Called on every keystroke — returns (label, loc_dict) pairs for the dropdown.
+
+    Queries are normalized (strip + lower) before hitting geocode so case and
+    whitespace variants of the same prefix share one cache entry.
+    """
+    q = query.strip().lower() if query else ""
+    if len(q) < 3:
         return []
     try:
-        results = geocode(query.strip())
-        return [(location_label(loc), loc) for loc in results]
+        return [(location_label(loc), loc) for loc in geocode(q)]
     except Exception:
         return []
 
 
+# Shared by every animation type — hoisted to module scope so the string is
+# built once, not on every rerun. The reduced-motion rule drops the whole
+# overlay so the browser never composites the particles for users who asked
+# for less motion.
+_KEYFRAMES_CSS = """<style>
+@media (prefers-reduced-motion: reduce) {
+  .wt-overlay { display: none; }
+  .wt-overlay * { animation: none !important; }
+}
+@keyframes wt-rain    { from{transform:translateY(-30px) translateX(0)}   to{transform:translateY(105vh) translateX(-15px)} }
+@keyframes wt-snow    { 0%{transform:translateY(-20px) translateX(0);opacity:.9} 25%{transform:translateY(25vh) translateX(20px)} 75%{transform:translateY(75vh) translateX(-15px)} 100%{transform:translateY(105vh) translateX(5px);opacity:.3} }
+@keyframes wt-star    { 0%,100%{opacity:.15;transform:scale(.8)} 50%{opacity:.9;transform:scale(1.2)} }
+@keyframes wt-sun-glow{ 0%,100%{box-shadow:0 0 50px 25px rgba(255,200,50,.3),0 0 100px 50px rgba(255,140,0,.12)} 50%{box-shadow:0 0 70px 40px rgba(255,200,50,.45),0 0 140px 70px rgba(255,140,0,.2)} }
+@keyframes wt-ray-cw  { from{transform:rotate(0deg)}   to{transform:rotate(360deg)} }
+@keyframes wt-ray-ccw { from{transform:rotate(0deg)}   to{transform:rotate(-360deg)} }
+@keyframes wt-cloud   { from{transform:translateX(-220px)} to{transform:translateX(110vw)} }
+@keyframes wt-fog     { 0%{transform:translateX(-30%);opacity:0} 15%{opacity:1} 85%{opacity:1} 100%{transform:translateX(110%);opacity:0} }
+@keyframes wt-flash   { 0%,100%{opacity:0} 5%{opacity:.55} 6%{opacity:0} 7%{opacity:.3} 8%{opacity:0} }
+</style>"""
+
+# One template per particle type — formatted with str.format inside a single
+# "".join instead of re-parsing a multi-field f-string per particle.
+_RAIN_TMPL = (
+    '<div style="position:absolute;left:{l}%;top:0;width:1.5px;height:{h}px;'
+    'background:linear-gradient(transparent,rgba(100,181,246,{op}));'
+    'animation:wt-rain {dur}s {d}s linear infinite;border-radius:1px;"></div>'
+)
+_SNOW_TMPL = (
+    '<div style="position:absolute;left:{l}%;top:-24px;font-size:{size}rem;'
+    'color:rgba(255,255,255,{op});'
+    'animation:wt-snow {dur}s {d}s linear infinite;'
+    'user-select:none;">{ch}</div>'
+)
+_STAR_TMPL = (
+    '<div style="position:absolute;top:{t}%;left:{l}%;'
+    'width:{size}rem;height:{size}rem;background:white;border-radius:50%;'
+    'animation:wt-star {dur}s {d}s ease-in-out infinite;"></div>'
+)
+_CLOUD_TMPL = (
+    '<div style="position:absolute;top:{t}%;left:-{w}px;'
+    'width:{w}px;height:{half}px;'
+    'background:rgba(200,220,255,{op});border-radius:50%;filter:blur(12px);'
+    'animation:wt-cloud {dur}s {d}s linear infinite;"></div>'
+)
+_FOG_TMPL = (
+    '<div style="position:absolute;top:{t}%;left:0;width:100%;height:{h}px;'
+    'background:rgba(200,220,240,{op});filter:blur(18px);'
+    'animation:wt-fog {dur}s {d}s linear infinite;"></div>'
+)
+
+
+@st.cache_data(ttl=86400, max_entries=64)
 def get_weather_animation_html(code: int, is_day: bool) -> str:
-    """Return a fixed-position animated weather overlay (pointer-events:none)."""
-    rng = random.Random(code * 31 + (0 if is_day else 1000))
+    """Return a fixed-position animated weather overlay (pointer-events:none).
+
+    Deterministic on (code, is_day) — the RNG is seeded from the arguments —
+    so the generated HTML is safe to cache across reruns.
+    """
+    rng = np.random.default_rng(code * 31 + (0 if is_day else 1000))
 
     if code in (95, 96, 99):
         anim = "thunder"
@@ -105,34 +203,20 @@ def get_weather_animation_html(code: int, is_day: bool) -> str:
     else:
         anim = "clear_day" if is_day else "clear_night"
 
-    keyframes = """<style>
-@keyframes wt-rain    { from{transform:translateY(-30px) translateX(0)}   to{transform:translateY(105vh) translateX(-15px)} }
-@keyframes wt-snow    { 0%{transform:translateY(-20px) translateX(0);opacity:.9} 25%{transform:translateY(25vh) translateX(20px)} 75%{transform:translateY(75vh) translateX(-15px)} 100%{transform:translateY(105vh) translateX(5px);opacity:.3} }
-@keyframes wt-star    { 0%,100%{opacity:.15;transform:scale(.8)} 50%{opacity:.9;transform:scale(1.2)} }
-@keyframes wt-sun-glow{ 0%,100%{box-shadow:0 0 50px 25px rgba(255,200,50,.3),0 0 100px 50px rgba(255,140,0,.12)} 50%{box-shadow:0 0 70px 40px rgba(255,200,50,.45),0 0 140px 70px rgba(255,140,0,.2)} }
-@keyframes wt-ray-cw  { from{transform:rotate(0deg)}   to{transform:rotate(360deg)} }
-@keyframes wt-ray-ccw { from{transform:rotate(0deg)}   to{transform:rotate(-360deg)} }
-@keyframes wt-cloud   { from{transform:translateX(-220px)} to{transform:translateX(110vw)} }
-@keyframes wt-fog     { 0%{transform:translateX(-30%);opacity:0} 15%{opacity:1} 85%{opacity:1} 100%{transform:translateX(110%);opacity:0} }
-@keyframes wt-flash   { 0%,100%{opacity:0} 5%{opacity:.55} 6%{opacity:0} 7%{opacity:.3} 8%{opacity:0} }
-</style>"""
-
-    wrap = '<div style="position:fixed;top:0;left:0;width:100vw;height:100vh;pointer-events:none;z-index:9999;overflow:hidden;">'
+    wrap = '<div class="wt-overlay" style="position:fixed;top:0;left:0;width:100vw;height:100vh;pointer-events:none;z-index:9999;overflow:hidden;">'
     parts = []
 
     if anim in ("rain", "thunder"):
         count = 55 if code in (65, 82) else 30
-        for _ in range(count):
-            left = rng.randint(0, 100)
-            h    = rng.randint(12, 28)
-            d    = round(rng.uniform(0, 3), 2)
-            dur  = round(rng.uniform(0.55, 1.3), 2)
-            op   = round(rng.uniform(0.35, 0.65), 2)
-            parts.append(
-                f'<div style="position:absolute;left:{left}%;top:0;width:1.5px;height:{h}px;'
-                f'background:linear-gradient(transparent,rgba(100,181,246,{op}));'
-                f'animation:wt-rain {dur}s {d}s linear infinite;border-radius:1px;"></div>'
-            )
+        lefts = rng.integers(0, 101, count)
+        hs    = rng.integers(12, 29, count)
+        ds    = np.round(rng.uniform(0, 3, count), 2)
+        durs  = np.round(rng.uniform(0.55, 1.3, count), 2)
+        ops   = np.round(rng.uniform(0.35, 0.65, count), 2)
+        parts.append("".join(
+            _RAIN_TMPL.format(l=l, h=h, d=d, dur=dur, op=op)
+            for l, h, d, dur, op in zip(lefts, hs, ds, durs, ops)
+        ))
         if anim == "thunder":
             parts.append(
                 '<div style="position:absolute;inset:0;background:rgba(180,210,255,.18);'
@@ -140,19 +224,17 @@ def get_weather_animation_html(code: int, is_day: bool) -> str:
             )
 
     elif anim == "snow":
-        for _ in range(38):
-            left = rng.randint(0, 100)
-            size = round(rng.uniform(0.7, 1.7), 1)
-            d    = round(rng.uniform(0, 12), 2)
-            dur  = round(rng.uniform(7, 16), 2)
-            op   = round(rng.uniform(0.45, 0.8), 2)
-            ch   = rng.choice(["❄", "❅", "❆", "·", "•"])
-            parts.append(
-                f'<div style="position:absolute;left:{left}%;top:-24px;font-size:{size}rem;'
-                f'color:rgba(255,255,255,{op});'
-                f'animation:wt-snow {dur}s {d}s linear infinite;'
-                f'user-select:none;">{ch}</div>'
-            )
+        count = 38
+        lefts = rng.integers(0, 101, count)
+        sizes = np.round(rng.uniform(0.7, 1.7, count), 1)
+        ds    = np.round(rng.uniform(0, 12, count), 2)
+        durs  = np.round(rng.uniform(7, 16, count), 2)
+        ops   = np.round(rng.uniform(0.45, 0.8, count), 2)
+        chs   = rng.choice(["❄", "❅", "❆", "·", "•"], count)
+        parts.append("".join(
+            _SNOW_TMPL.format(l=l, size=size, d=d, dur=dur, op=op, ch=ch)
+            for l, size, d, dur, op, ch in zip(lefts, sizes, ds, durs, ops, chs)
+        ))
 
     elif anim == "clear_day":
         parts += [
@@ -168,51 +250,52 @@ def get_weather_animation_html(code: int, is_day: bool) -> str:
         ]
 
     elif anim == "clear_night":
-        for _ in range(60):
-            top  = rng.randint(2, 65)
-            left = rng.randint(0, 100)
-            size = round(rng.uniform(0.18, 0.45), 2)
-            d    = round(rng.uniform(0, 6), 2)
-            dur  = round(rng.uniform(2, 5), 2)
-            parts.append(
-                f'<div style="position:absolute;top:{top}%;left:{left}%;'
-                f'width:{size}rem;height:{size}rem;background:white;border-radius:50%;'
-                f'animation:wt-star {dur}s {d}s ease-in-out infinite;"></div>'
-            )
+        count = 60
+        tops  = rng.integers(2, 66, count)
+        lefts = rng.integers(0, 101, count)
+        sizes = np.round(rng.uniform(0.18, 0.45, count), 2)
+        ds    = np.round(rng.uniform(0, 6, count), 2)
+        durs  = np.round(rng.uniform(2, 5, count), 2)
+        parts.append("".join(
+            _STAR_TMPL.format(t=t, l=l, size=size, d=d, dur=dur)
+            for t, l, size, d, dur in zip(tops, lefts, sizes, ds, durs)
+        ))
 
     elif anim in ("partly_cloudy", "overcast"):
         count = 3 if anim == "partly_cloudy" else 6
         op    = 0.10 if anim == "partly_cloudy" else 0.18
-        for _ in range(count):
-            top = rng.randint(3, 40)
-            w   = rng.randint(120, 220)
-            d   = rng.randint(0, 20)
-            dur = rng.randint(30, 60)
-            parts.append(
-                f'<div style="position:absolute;top:{top}%;left:-{w}px;'
-                f'width:{w}px;height:{w // 2}px;'
-                f'background:rgba(200,220,255,{op});border-radius:50%;filter:blur(12px);'
-                f'animation:wt-cloud {dur}s {d}s linear infinite;"></div>'
-            )
+        tops  = rng.integers(3, 41, count)
+        ws    = rng.integers(120, 221, count)
+        ds    = rng.integers(0, 21, count)
+        durs  = rng.integers(30, 61, count)
+        parts.append("".join(
+            _CLOUD_TMPL.format(t=t, w=w, half=w // 2, op=op, d=d, dur=dur)
+            for t, w, d, dur in zip(tops, ws, ds, durs)
+        ))
 
     elif anim == "fog":
-        for _ in range(6):
-            top = rng.randint(5, 85)
-            h   = rng.randint(50, 120)
-            d   = rng.randint(0, 25)
-            dur = rng.randint(18, 35)
-            op  = round(rng.uniform(0.05, 0.12), 2)
-            parts.append(
-                f'<div style="position:absolute;top:{top}%;left:0;width:100%;height:{h}px;'
-                f'background:rgba(200,220,240,{op});filter:blur(18px);'
-                f'animation:wt-fog {dur}s {d}s linear infinite;"></div>'
-            )
+        count = 6
+        tops  = rng.integers(5, 86, count)
+        hs    = rng.integers(50, 121, count)
+        ds    = rng.integers(0, 26, count)
+        durs  = rng.integers(18, 36, count)
+        ops   = np.round(rng.uniform(0.05, 0.12, count), 2)
+        parts.append("".join(
+            _FOG_TMPL.format(t=t, h=h, d=d, dur=dur, op=op)
+            for t, h, d, dur, op in zip(tops, hs, ds, durs, ops)
+        ))
 
-    return keyframes + wrap + "".join(parts) + "</div>"
+    return wrap + "".join(parts) + "</div>"
 
 
 @st.cache_data(ttl=600)
-def fetch_weather(lat: float, lon: float, timezone: str, temp_unit: str = "fahrenheit"):
+def fetch_weather(lat: float, lon: float, timezone: str, temp_unit: str = "fahrenheit",
+                  force: bool = False):
+    """Fetch current conditions + 5-day forecast.
+
+    force=True revalidates with the server instead of reading the on-disk
+    requests-cache entry — used by the explicit refresh button.
+    """
     params = {
         "latitude": lat,
         "longitude": lon,
@@ -227,67 +310,27 @@ def fetch_weather(lat: float, lon: float, timezone: str, temp_unit: str = "fahre
         ],
         "daily": [
             "weather_code", "temperature_2m_max", "temperature_2m_min",
-            "precipitation_sum", "precipitation_probability_max",
+            "precipitation_probability_max",
         ],
         "forecast_days": 5,
     }
-    r = requests.get(WEATHER_API, params=params, timeout=10)
+    r = _SESSION.get(WEATHER_API, params=params, timeout=10, refresh=force)
     r.raise_for_status()
-    return r.json()
+    return orjson.loads(r.content)
 
 
 # ── Page setup ────────────────────────────────────────────────────────────
 st.set_page_config(page_title="Weather", page_icon="🌤️", layout="centered")
 
-st.markdown("""
-<style>
-  .stApp { background-color: #1a2535; }
-  #MainMenu, footer, header { visibility: hidden; }
-
-  /* Searchbox */
-  div[data-testid="stCustomComponentV1"] iframe {
-    border-radius: 10px;
-  }
-
-  /* Temperature */
-  .temp-display {
-    font-size: 5rem; font-weight: 700; color: #ffffff; line-height: 1;
-  }
-  .cond-icon { font-size: 3.5rem; line-height: 1; }
-
-  /* Stat cards */
-  .stat-card {
-    background: #223047; border-radius: 12px;
-    padding: 14px 10px; text-align: center;
-  }
-  .stat-icon  { font-size: 1.6rem; }
-  .stat-value { font-size: 1.3rem; font-weight: 700; color: #ffffff; margin: 2px 0; }
-  .stat-label { font-size: 0.75rem; color: #8ba7c7; }
-
-  /* Forecast cards */
-  .fc-card {
-    background: #223047; border-radius: 12px;
-    padding: 12px 8px; text-align: center;
-  }
-  .fc-day  { font-size: 0.8rem; font-weight: 700; color: #8ba7c7; }
-  .fc-icon { font-size: 1.8rem; line-height: 1.4; }
-  .fc-hi   { font-size: 1rem; font-weight: 700; color: #ffffff; }
-  .fc-lo   { font-size: 0.9rem; color: #8ba7c7; }
-  .fc-rain { font-size: 0.75rem; color: #64b5f6; margin-top: 2px; }
-
-  .subtext { color: #8ba7c7; font-size: 0.9rem; }
-  .feels   { color: #8ba7c7; font-size: 1rem; margin-top: -4px; }
-  hr { border-color: #223047 !important; margin: 1rem 0; }
-
-  div[data-testid="stButton"] > button {
-    background: #223047; color: #5bc8f5;
-    border: 1px solid #5bc8f5; border-radius: 8px; padding: 6px 20px;
-  }
-  div[data-testid="stButton"] > button:hover {
-    background: #5bc8f5; color: #1a2535;
-  }
-</style>
-""", unsafe_allow_html=True)
+
+@st.cache_resource
+def load_css() -> str:
+    """Read style.css once per process and keep it as a ready <style> block."""
+    css = (Path(__file__).parent / "style.css").read_text()
+    return f"<style>\n{css}</style>"
+
+
+st.markdown(load_css(), unsafe_allow_html=True)
 
 
 # ── Session state defaults ────────────────────────────────────────────────
@@ -296,6 +339,24 @@ if "location" not in st.session_state:
 if "temp_unit" not in st.session_state:
     st.session_state.temp_unit = "fahrenheit"
 
+# Kick off the default-location fetch in the background so the HTTP round-trip
+# overlaps Streamlit's own first-render work instead of blocking it. Submitted
+# once per session; render_weather marks the future consumed (sets it to None)
+# rather than removing the key, so reruns never re-submit it.
+@st.cache_resource
+def _worker_pool() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(max_workers=2)
+
+
+if "weather_prefetch" not in st.session_state:
+    st.session_state.weather_prefetch = _worker_pool().submit(
+        fetch_weather,
+        DEFAULT_LOCATION["latitude"],
+        DEFAULT_LOCATION["longitude"],
+        DEFAULT_LOCATION["timezone"],
+        st.session_state.temp_unit,
+    )
+
 
 # ── Live search bar ───────────────────────────────────────────────────────
 selected = st_searchbox(
@@ -307,133 +368,148 @@ selected = st_searchbox(
 )
 
 if selected:
+    # No cache clear needed: the new (lat, lon, tz, unit) key misses naturally,
+    # and wiping everything would throw away warm entries for other cities.
     st.session_state.location = selected
-    st.cache_data.clear()
-
-
-# ── Fetch weather for selected location ───────────────────────────────────
-loc = st.session_state.location
-try:
-    data = fetch_weather(loc["latitude"], loc["longitude"], loc["timezone"], st.session_state.temp_unit)
-except Exception as e:
-    st.error(f"Could not fetch weather: {e}")
-    st.stop()
-
-cur   = data["current"]
-daily = data["daily"]
-
-code           = cur["weather_code"]
-condition, icon = WMO_CODES.get(code, ("Unknown", "❓"))
-wind_dir       = wind_dir_label(cur["wind_direction_10m"])
-dt             = datetime.fromisoformat(cur["time"])
-day_night      = "☀ Day" if cur["is_day"] else "☾ Night"
-time_str       = dt.strftime("%A, %B %-d  •  %-I:%M %p")
-
-# ── Weather animation overlay ──────────────────────────────────────────────
-st.markdown(get_weather_animation_html(code, bool(cur["is_day"])), unsafe_allow_html=True)
-
-
-# ── Header ────────────────────────────────────────────────────────────────
-unit_symbol = "F" if st.session_state.temp_unit == "fahrenheit" else "C"
-
-col_title, col_unit, col_refresh = st.columns([4, 1, 1])
-with col_title:
-    st.markdown(f"## 📍 {location_label(loc)}")
-    st.markdown(f'<p class="subtext">{time_str} &nbsp;·&nbsp; {day_night}</p>',
-                unsafe_allow_html=True)
-with col_unit:
-    st.markdown("<br>", unsafe_allow_html=True)
-    chosen = st.radio("Unit", ["°F", "°C"], index=0 if st.session_state.temp_unit == "fahrenheit" else 1,
-                      horizontal=True, label_visibility="collapsed")
-    new_unit = "fahrenheit" if chosen == "°F" else "celsius"
-    if new_unit != st.session_state.temp_unit:
-        st.session_state.temp_unit = new_unit
-        st.cache_data.clear()
-        st.rerun()
-with col_refresh:
-    st.markdown("<br>", unsafe_allow_html=True)
-    if st.button("⟳ Refresh"):
-        st.cache_data.clear()
-        st.rerun()
-
-st.markdown("---")
-
-
-# ── Current conditions ────────────────────────────────────────────────────
-col_left, col_right = st.columns([1, 1])
-with col_left:
-    st.markdown(f'<div class="cond-icon">{icon}</div>', unsafe_allow_html=True)
-    st.markdown(f"**{condition}**")
-    st.markdown(f'<p class="feels">Feels like {cur["apparent_temperature"]:.0f}°{unit_symbol}</p>',
-                unsafe_allow_html=True)
-with col_right:
-    st.markdown(
-        f'<div class="temp-display">{cur["temperature_2m"]:.0f}°'
-        f'<span style="font-size:2rem;color:#8ba7c7">{unit_symbol}</span></div>',
-        unsafe_allow_html=True,
-    )
-
-st.markdown("---")
 
 
-# ── Stats row ─────────────────────────────────────────────────────────────
-stats = [
-    ("💧", f'{cur["relative_humidity_2m"]}%',              "Humidity"),
-    ("💨", f'{cur["wind_speed_10m"]:.0f} mph {wind_dir}',  "Wind"),
-    ("🌬️", f'{cur["wind_gusts_10m"]:.0f} mph',             "Gusts"),
-    ("☁️",  f'{cur["cloud_cover"]}%',                       "Cloud Cover"),
-]
-cols = st.columns(4)
-for col, (icon_s, value, label) in zip(cols, stats):
-    with col:
-        st.markdown(
+# ── Weather display ───────────────────────────────────────────────────────
+@st.fragment
+def render_weather(loc):
+    """Fetch + render everything below the searchbox.
+
+    Runs as a fragment so the unit toggle and refresh button rerun only
+    this block — the searchbox and page chrome stay untouched.
+    """
+    force = st.session_state.pop("force_refresh", False)
+    data = None
+    prefetch = st.session_state.get("weather_prefetch")
+    if prefetch is not None and loc is DEFAULT_LOCATION and not force:
+        # Consume the future before asking for its result: a failed future
+        # re-raises the same stored exception on every .result() call, so a
+        # transient error at session start must not be replayed forever.
+        st.session_state.weather_prefetch = None
+        try:
+            data = prefetch.result(timeout=10)
+        except Exception:
+            data = None  # fall through to a fresh synchronous fetch
+    if data is None:
+        try:
+            data = fetch_weather(loc["latitude"], loc["longitude"], loc["timezone"],
+                                 st.session_state.temp_unit, force=force)
+        except Exception as e:
+            st.error(f"Could not fetch weather: {e}")
+            st.stop()
+
+    cur   = data["current"]
+    daily = data["daily"]
+
+    code           = cur["weather_code"]
+    condition, icon = wmo_label(code)
+    wind_dir       = wind_dir_label(cur["wind_direction_10m"])
+    dt             = datetime.strptime(cur["time"], _CUR_TIME_FMT)
+    day_night      = "☀ Day" if cur["is_day"] else "☾ Night"
+    time_str       = dt.strftime("%A, %B %-d  •  %-I:%M %p")
+
+    # ── Weather animation overlay ──────────────────────────────────────────
+    st.markdown(_KEYFRAMES_CSS, unsafe_allow_html=True)
+    st.markdown(get_weather_animation_html(code, bool(cur["is_day"])), unsafe_allow_html=True)
+
+    # ── Header ──────────────────────────────────────────────────────────────
+    unit_symbol = "F" if st.session_state.temp_unit == "fahrenheit" else "C"
+
+    col_title, col_unit, col_refresh = st.columns([4, 1, 1])
+    with col_title:
+        st.markdown(f"## 📍 {location_label(loc)}")
+        st.markdown(f'<p class="subtext">{time_str} &nbsp;·&nbsp; {day_night}</p>',
+                    unsafe_allow_html=True)
+    with col_unit:
+        st.markdown("<br>", unsafe_allow_html=True)
+        chosen = st.radio("Unit", ["°F", "°C"], index=0 if st.session_state.temp_unit == "fahrenheit" else 1,
+                          horizontal=True, label_visibility="collapsed")
+        new_unit = "fahrenheit" if chosen == "°F" else "celsius"
+        if new_unit != st.session_state.temp_unit:
+            st.session_state.temp_unit = new_unit
+            fetch_weather.clear()
+            st.rerun(scope="fragment")
+    with col_refresh:
+        st.markdown("<br>", unsafe_allow_html=True)
+        if st.button("⟳ Refresh"):
+            fetch_weather.clear()
+            st.session_state.force_refresh = True
+            st.rerun(scope="fragment")
+
+    # ── Current conditions + stats ──────────────────────────────────────────
+    # None of this is interactive, so the whole middle block — separators
+    # included — goes out as one markdown call instead of ~10.
+    stats = [
+        ("💧", f'{cur["relative_humidity_2m"]}%',              "Humidity"),
+        ("💨", f'{cur["wind_speed_10m"]:.0f} mph {wind_dir}',  "Wind"),
+        ("🌬️", f'{cur["wind_gusts_10m"]:.0f} mph',             "Gusts"),
+        ("☁️",  f'{cur["cloud_cover"]}%',                       "Cloud Cover"),
+    ]
+    middle = [
+        '<hr/>',
+        '<div style="display:flex;justify-content:space-between;align-items:center">',
+        f'<div><div class="cond-icon">{icon}</div>'
+        f'<b>{condition}</b>'
+        f'<p class="feels">Feels like {cur["apparent_temperature"]:.0f}°{unit_symbol}</p></div>',
+        f'<div class="temp-display">{cur["temperature_2m"]:.0f}°'
+        f'<span style="font-size:2rem;color:#8ba7c7">{unit_symbol}</span></div>',
+        '</div>',
+        '<hr/>',
+        '<div style="display:grid;grid-template-columns:repeat(4,1fr);gap:8px">',
+        "".join(
             f'<div class="stat-card">'
             f'<div class="stat-icon">{icon_s}</div>'
             f'<div class="stat-value">{value}</div>'
             f'<div class="stat-label">{label}</div>'
-            f'</div>',
-            unsafe_allow_html=True,
+            f'</div>'
+            for icon_s, value, label in stats
+        ),
+        '</div>',
+    ]
+    if cur["precipitation"] > 0:
+        middle.append(
+            f'<p class="subtext" style="margin-top:10px">🌧 Current precipitation: {cur["precipitation"]:.2f} in</p>'
         )
-
-if cur["precipitation"] > 0:
-    st.markdown(
-        f'<p class="subtext" style="margin-top:10px">🌧 Current precipitation: {cur["precipitation"]:.2f} in</p>',
-        unsafe_allow_html=True,
-    )
-
-st.markdown("---")
-
-
-# ── 5-Day Forecast ────────────────────────────────────────────────────────
-st.markdown("**5-Day Forecast**")
-fc_cols = st.columns(5)
-for i, col in enumerate(fc_cols):
-    date    = datetime.fromisoformat(daily["time"][i])
-    fc_code = daily["weather_code"][i]
-    _, fc_icon = WMO_CODES.get(fc_code, ("?", "❓"))
-    hi   = daily["temperature_2m_max"][i]
-    lo   = daily["temperature_2m_min"][i]
-    prob = daily["precipitation_probability_max"][i] or 0
-
-    day_label = "Today" if i == 0 else date.strftime("%a")
-    rain_html = f'<div class="fc-rain">💧 {prob}%</div>' if prob > 10 else ""
-
-    with col:
-        st.markdown(
+    middle.append('<hr/>')
+    st.markdown("".join(middle), unsafe_allow_html=True)
+
+    # ── 5-Day Forecast ──────────────────────────────────────────────────────
+    fc_dates = [datetime.strptime(t, _DAILY_DATE_FMT) for t in daily["time"]]
+    fc_cards = []
+    for i in range(5):
+        date    = fc_dates[i]
+        fc_code = daily["weather_code"][i]
+        _, fc_icon = wmo_label(fc_code)
+        hi   = daily["temperature_2m_max"][i]
+        lo   = daily["temperature_2m_min"][i]
+        prob = daily["precipitation_probability_max"][i] or 0
+
+        day_label = "Today" if i == 0 else date.strftime("%a")
+        rain_html = f'<div class="fc-rain">💧 {prob}%</div>' if prob > 10 else ""
+
+        fc_cards.append(
             f'<div class="fc-card">'
             f'<div class="fc-day">{day_label}</div>'
             f'<div class="fc-icon">{fc_icon}</div>'
             f'<div class="fc-hi">{hi:.0f}°{unit_symbol}</div>'
             f'<div class="fc-lo">{lo:.0f}°{unit_symbol}</div>'
             f'{rain_html}'
-            f'</div>',
-            unsafe_allow_html=True,
+            f'</div>'
         )
 
-st.markdown("<br>", unsafe_allow_html=True)
-updated = datetime.now().strftime("%-I:%M %p")
-st.markdown(
-    f'<p class="subtext" style="text-align:center">'
-    f'Last updated {updated} · Data from Open-Meteo</p>',
-    unsafe_allow_html=True,
-)
\ No newline at end of file
+    updated = datetime.now().strftime("%-I:%M %p")
+    st.markdown(
+        '<b>5-Day Forecast</b>'
+        '<div style="display:grid;grid-template-columns:repeat(5,1fr);gap:8px">'
+        + "".join(fc_cards)
+        + '</div><br/>'
+        f'<p class="subtext" style="text-align:center">'
+        f'Last updated {updated} · Data from Open-Meteo</p>',
+        unsafe_allow_html=True,
+    )
+
+
+render_weather(st.session_state.location)
\ No newline at end of file